@@ -19,6 +19,7 @@ from __future__ import print_function
 import functools
 import tempfile
 
+import numpy
 import six
 
 from tensorflow.python.client import session
@@ -131,6 +132,23 @@ class TimeSeriesRegressorTest(test.TestCase):
             },
             signatures=signatures,
             session=sess)
+        # This export builds all of its signatures from one serving input
+        # receiver, so the FILTER and PREDICT signatures share input
+        # placeholders and the fused filter+predict entry point must refuse to
+        # run rather than silently clobber the filter's feeds.
+        with self.assertRaisesRegexp(ValueError, "share input placeholders"):
+          saved_model_utils.filter_and_predict_continuation(
+              continue_from=first_filtering,
+              signatures=signatures,
+              session=sess,
+              filter_features={
+                  feature_keys.FilteringFeatures.TIMES:
+                      numpy.array([[22, 23]]),
+                  feature_keys.FilteringFeatures.VALUES:
+                      numpy.ones([1, 2, 1]),
+                  "exogenous": numpy.ones([1, 2, 1])
+              },
+              predict_steps=1)
         # Test that prediction and filtering can continue from filtering output
         second_saved_prediction = saved_model_utils.predict_continuation(
             continue_from=first_filtering,
@@ -17,12 +17,24 @@
 @@predict_continuation
 @@cold_start_filter
 @@filter_continuation
+@@filter_and_predict_continuation
+@@predict_continuation_batch
+@@predict_continuation_compiled
+@@predict_continuation_async
+@@canonicalize_numpy_data_inplace
+@@SignatureBundle
+@@CompiledSignature
+@@FilterResult
 """
 
 from __future__ import absolute_import
 from __future__ import division
 from __future__ import print_function
 
+import itertools
+import threading
+import weakref
+
 import numpy
 
 from tensorflow.python.util.all_util import remove_undocumented
@@ -30,6 +42,147 @@ from tensorflow_estimator.python.estimator.canned.timeseries import feature_keys
 from tensorflow_estimator.python.estimator.canned.timeseries import head as _head
 from tensorflow_estimator.python.estimator.canned.timeseries import model_utils as _model_utils
 
+# Error messages in this module are formatted only on the raise path (adjacent
+# string literals are folded at compile time, so the multi-line messages cost
+# nothing when validation passes); keep it that way, since these functions sit
+# on the per-request serving hot path.
+
+# Bind the numpy functions used on every request once at module load; each
+# `numpy.<attr>` reference is a module attribute lookup in the hot functions.
+_asarray = numpy.asarray
+_ascontiguousarray = numpy.ascontiguousarray
+
+# Signature labels and feature keys used on every request, bound once at
+# module load to avoid repeated attribute-chain lookups in the hot functions.
+_PREDICT_SIGNATURE_LABEL = _feature_keys.SavedModelLabels.PREDICT
+_FILTER_SIGNATURE_LABEL = _feature_keys.SavedModelLabels.FILTER
+_COLD_START_FILTER_SIGNATURE_LABEL = (
+    _feature_keys.SavedModelLabels.COLD_START_FILTER)
+_TRAIN_EVAL_TIMES_KEY = _feature_keys.TrainEvalFeatures.TIMES
+_TRAIN_EVAL_VALUES_KEY = _feature_keys.TrainEvalFeatures.VALUES
+_FILTERING_TIMES_KEY = _feature_keys.FilteringFeatures.TIMES
+_FILTERING_RESULTS_TIMES_KEY = _feature_keys.FilteringResults.TIMES
+_PREDICTION_TIMES_KEY = _feature_keys.PredictionFeatures.TIMES
+_PREDICTION_RESULTS_TIMES_KEY = _feature_keys.PredictionResults.TIMES
+_STATE_TUPLE_KEY = _feature_keys.FilteringResults.STATE_TUPLE
+
+# Private keys used to carry cached values through chained calls
+# (filter -> predict -> filter -> ...). Keys beginning with "__" are
+# bookkeeping only and are never fed to the model.
+_ALREADY_CANONICAL_KEY = "__canonical"
+_FLAT_STATE_CACHE_KEY = "__flat_state_cache"
+
+# Bound once at module load; called on every continuation with nested state.
+_state_to_dictionary = _head.state_to_dictionary
+
+
+class SignatureBundle(object):
+  """Pre-extracted signature_defs for a loaded time series saved model.
+
+  `MetaGraphDef.signature_def` is a protocol buffer map, so looking a
+  signature up in it on every request is measurable overhead under high
+  request rates. Constructing a `SignatureBundle` once per loaded model
+  performs the three lookups ahead of time; instances may be passed anywhere
+  the functions in this module accept a `signatures` argument.
+  """
+
+  __slots__ = ("predict", "filter", "cold_start_filter")
+
+  def __init__(self, signatures):
+    """Extracts signature_defs from a loaded model's `MetaGraphDef`.
+
+    Args:
+      signatures: The `MetaGraphDef` protocol buffer returned from
+        `tf.saved_model.loader.load`.
+    """
+    signature_def = signatures.signature_def
+    self.predict = signature_def[_PREDICT_SIGNATURE_LABEL]
+    self.filter = signature_def[_FILTER_SIGNATURE_LABEL]
+    self.cold_start_filter = signature_def[_COLD_START_FILTER_SIGNATURE_LABEL]
+
+
+class FilterResult(dict):
+  """Filtering output with attribute access to its structured fields.
+
+  Subclasses `dict` so existing callers can keep indexing results by key,
+  while chained callers use the `state` and `times` properties and skip the
+  per-key hashing and membership tests of the plain-dict path.
+  """
+
+  __slots__ = ()
+
+  @property
+  def times(self):
+    """The [batch size x series length] times the filter has consumed."""
+    return self[_FILTERING_RESULTS_TIMES_KEY]
+
+  @property
+  def state(self):
+    """Flattened model state, keyed as expected by continuation feeds."""
+    state_values = self.get(_FLAT_STATE_CACHE_KEY)
+    if state_values is None:
+      if _STATE_TUPLE_KEY in self:
+        state_values = _state_to_dictionary(self[_STATE_TUPLE_KEY])
+      else:
+        state_values = {
+            key: value for key, value in self.items()
+            if key != _FILTERING_RESULTS_TIMES_KEY and
+            not key.startswith("__")
+        }
+      # Stash the flattened form so later hops in a filter -> predict ->
+      # filter chain skip re-flattening.
+      self[_FLAT_STATE_CACHE_KEY] = state_values
+    return state_values
+
+  def as_dict(self):
+    """Returns a plain-dict copy, for callers that require an exact dict."""
+    return dict(self)
+
+
+class CompiledSignature(object):
+  """A signature pre-compiled with `Session.make_callable` for tight loops.
+
+  `session.run(fetches, feed_dict=...)` matches the string-keyed feed
+  dictionary against placeholders and validates it on every call.
+  `Session.make_callable` compiles that machinery once into a callable bound
+  to a fixed feed/fetch order, eliminating the per-call marshalling; for
+  loops over many short time series windows this is the dominant Python-side
+  overhead.
+
+  The dict-based functions in this module remain the general API; this
+  wrapper is the fast path for repeated calls against a single signature.
+  """
+
+  __slots__ = ("feed_key_order", "_output_keys", "_callable")
+
+  def __init__(self, session, signature, feature_key_order,
+               state_key_order=()):
+    """Compiles a callable bound to a fixed feed and fetch order.
+
+    Args:
+      session: The session into which the saved model was loaded.
+      signature: A `SignatureDef` proto from the loaded model's
+        `MetaGraphDef` (e.g. an attribute of a `SignatureBundle`).
+      feature_key_order: An ordered sequence of the signature's feature input
+        keys that the caller will pass values for.
+      state_key_order: An ordered sequence of the signature's state input keys
+        that the caller will pass values for; state values are fed before
+        feature values.
+    """
+    input_feed_tensors_by_name, output_tensors_by_name = (
+        _resolve_signature_tensors(session.graph, signature))
+    self.feed_key_order = tuple(state_key_order) + tuple(feature_key_order)
+    self._output_keys = list(output_tensors_by_name.keys())
+    self._callable = session.make_callable(
+        fetches=[output_tensors_by_name[key] for key in self._output_keys],
+        feed_list=[input_feed_tensors_by_name[key]
+                   for key in self.feed_key_order])
+
+  def run(self, values):
+    """Runs the compiled callable on values ordered like `feed_key_order`."""
+    fetched = self._callable(*values)
+    return dict(zip(self._output_keys, fetched))
+
 
 def _canonicalize_numpy_data(data, require_single_batch):
   """Do basic checking and reshaping for Numpy data.
@@ -57,54 +210,88 @@ def _canonicalize_numpy_data(data, require_single_batch):
     ValueError: If dimensions are incorrect or do not match, or required
       features are missing.
   """
-  features = {key: numpy.array(value) for key, value in data.items()}
-  if (_feature_keys.TrainEvalFeatures.TIMES not in features or
-      _feature_keys.TrainEvalFeatures.VALUES not in features):
+  if data.get(_ALREADY_CANONICAL_KEY):
+    # This dictionary was produced by a previous call; skip reprocessing it.
+    # The batch requirement still depends on the current caller, so it is
+    # re-checked rather than skipped with the rest of the validation.
+    if (require_single_batch and
+        data[_TRAIN_EVAL_TIMES_KEY].shape[0] != 1):
+      raise ValueError("Got batch input, was expecting unbatched input.")
+    return data
+  # `asarray` returns the original buffer when the value is already an ndarray,
+  # avoiding an unconditional copy on the inference hot path; downstream code
+  # only reads shapes and adds broadcast axes, so zero-copy is safe.
+  features = {key: _asarray(value) for key, value in data.items()}
+  if (_TRAIN_EVAL_TIMES_KEY not in features or
+      _TRAIN_EVAL_VALUES_KEY not in features):
     raise ValueError("{} and {} are required features.".format(
-        _feature_keys.TrainEvalFeatures.TIMES,
-        _feature_keys.TrainEvalFeatures.VALUES))
-  times = features[_feature_keys.TrainEvalFeatures.TIMES]
-  for key, value in features.items():
-    if value.shape[:len(times.shape)] != times.shape:
-      raise ValueError(
-          ("All features must have their shapes prefixed by the shape of the"
-           " times feature. Got shape {} for feature '{}', but shape {} for"
-           " '{}'").format(value.shape, key, times.shape,
-                           _feature_keys.TrainEvalFeatures.TIMES))
-  if not times.shape:  # a single example
-    if not features[_feature_keys.TrainEvalFeatures.VALUES].shape:  # univariate
+        _TRAIN_EVAL_TIMES_KEY,
+        _TRAIN_EVAL_VALUES_KEY))
+  times = features[_TRAIN_EVAL_TIMES_KEY]
+  # Hoist loop invariants; shape tuples and len() calls are re-computed per
+  # feature otherwise, which adds up for requests with many exogenous features.
+  times_shape = times.shape
+  times_ndim = len(times_shape)
+  # A single comprehension keeps the per-feature work to one tuple compare on
+  # the comprehension fast path; the error message is only constructed when a
+  # feature actually fails validation.
+  bad_features = [(key, value.shape)
+                  for key, value in features.items()
+                  if value.shape[:times_ndim] != times_shape]
+  if bad_features:
+    bad_key, bad_shape = bad_features[0]
+    raise ValueError(
+        ("All features must have their shapes prefixed by the shape of the"
+         " times feature. Got shape {} for feature '{}', but shape {} for"
+         " '{}'").format(bad_shape, bad_key, times_shape,
+                         _TRAIN_EVAL_TIMES_KEY))
+  if times_ndim == 2:
+    # Fast path: the input already has [batch size x series length]-prefixed
+    # shapes, the common steady-state serving case. The prefix validation
+    # above is all that's needed; skip the broadcast-axis handling below.
+    if require_single_batch and times_shape[0] != 1:
+      raise ValueError("Got batch input, was expecting unbatched input.")
+    features[_ALREADY_CANONICAL_KEY] = True
+    return features
+  values = features[_TRAIN_EVAL_VALUES_KEY]
+  if not times_shape:  # a single example
+    if not values.shape:  # univariate
       # Add a feature dimension (with one feature)
-      features[_feature_keys.TrainEvalFeatures.VALUES] = features[
-          _feature_keys.TrainEvalFeatures.VALUES][..., None]
-    elif len(features[_feature_keys.TrainEvalFeatures.VALUES].shape) > 1:
+      features[_TRAIN_EVAL_VALUES_KEY] = values[..., None]
+    elif len(values.shape) > 1:
       raise ValueError(
           ("Got an unexpected number of dimensions for the '{}' feature."
            " Was expecting at most 1 dimension"
            " ([number of features]) since '{}' does not "
            "have a batch or time dimension, but got shape {}").format(
-               _feature_keys.TrainEvalFeatures.VALUES,
-               _feature_keys.TrainEvalFeatures.TIMES,
-               features[_feature_keys.TrainEvalFeatures.VALUES].shape))
-    # Add trivial batch and time dimensions for every feature
-    features = {key: value[None, None, ...] for key, value in features.items()}
-  if len(times.shape) == 1:  # shape [series length]
-    if len(features[_feature_keys.TrainEvalFeatures.VALUES].shape
-          ) == 1:  # shape [series length]
+              _TRAIN_EVAL_VALUES_KEY,
+              _TRAIN_EVAL_TIMES_KEY, values.shape))
+    # Add trivial batch and time dimensions for every feature. `reshape` with
+    # prepended unit dimensions returns a view and is cheaper than `None`
+    # indexing, which goes through the general `__getitem__` tuple parsing.
+    features = {
+        key: value.reshape((1, 1) + value.shape)
+        for key, value in features.items()
+    }
+  if times_ndim == 1:  # shape [series length]
+    values = features[_TRAIN_EVAL_VALUES_KEY]
+    if len(values.shape) == 1:  # shape [series length]
       # Add a feature dimension (with one feature)
-      features[_feature_keys.TrainEvalFeatures.VALUES] = features[
-          _feature_keys.TrainEvalFeatures.VALUES][..., None]
-    elif len(features[_feature_keys.TrainEvalFeatures.VALUES].shape) > 2:
+      features[_TRAIN_EVAL_VALUES_KEY] = values[..., None]
+    elif len(values.shape) > 2:
       raise ValueError(
           ("Got an unexpected number of dimensions for the '{}' feature."
            " Was expecting at most 2 dimensions"
            " ([series length, number of features]) since '{}' does not "
            "have a batch dimension, but got shape {}").format(
-               _feature_keys.TrainEvalFeatures.VALUES,
-               _feature_keys.TrainEvalFeatures.TIMES,
-               features[_feature_keys.TrainEvalFeatures.VALUES].shape))
+              _TRAIN_EVAL_VALUES_KEY,
+              _TRAIN_EVAL_TIMES_KEY, values.shape))
     # Add trivial batch dimensions for every feature
-    features = {key: value[None, ...] for key, value in features.items()}
-  elif len(features[_feature_keys.TrainEvalFeatures.TIMES].shape
+    features = {
+        key: value.reshape((1,) + value.shape)
+        for key, value in features.items()
+    }
+  elif len(features[_TRAIN_EVAL_TIMES_KEY].shape
           ) != 2:  # shape [batch size, series length]
     raise ValueError(
         ("Got an unexpected number of dimensions for times. Was expecting at "
@@ -112,44 +299,224 @@ def _canonicalize_numpy_data(data, require_single_batch):
              times.shape))
   if require_single_batch:
     # We don't expect input to be already batched; batching is done later
-    if features[_feature_keys.TrainEvalFeatures.TIMES].shape[0] != 1:
+    if features[_TRAIN_EVAL_TIMES_KEY].shape[0] != 1:
       raise ValueError("Got batch input, was expecting unbatched input.")
+  features[_ALREADY_CANONICAL_KEY] = True
   return features
 
 
-def _colate_features_to_feeds_and_fetches(signature, features, graph,
-                                          continue_from=None):
-  """Uses a saved model signature to construct feed and fetch dictionaries."""
-  if continue_from is None:
-    state_values = {}
-  elif _feature_keys.FilteringResults.STATE_TUPLE in continue_from:
-    # We're continuing from an evaluation, so we need to unpack/flatten state.
-    state_values = _head.state_to_dictionary(
-        continue_from[_feature_keys.FilteringResults.STATE_TUPLE])
-  else:
-    state_values = continue_from
-  input_feed_tensors_by_name = {
-      input_key: graph.as_graph_element(input_value.name)
-      for input_key, input_value in signature.inputs.items()
+# Maps each graph (held weakly, so unloading a model evicts its entries) to an
+# inner dictionary of resolved (input, output) tensor dictionaries per
+# signature. Signatures never change once loaded, so resolving their tensor
+# names through `graph.as_graph_element` on every call is pure overhead.
+_signature_tensor_cache = weakref.WeakKeyDictionary()
+_signature_tensor_cache_lock = threading.Lock()
+
+
+def _resolve_signature_tensors(graph, signature):
+  """Resolves (and caches) a signature's input and output tensors in a graph.
+
+  `SignatureDef` protos are not hashable, so within each graph's cache entries
+  are keyed on the signature's id; each entry holds a strong reference to its
+  signature so the id cannot be recycled while the entry is alive. The outer
+  mapping is keyed weakly on the graph itself, so dropping a graph (e.g. when
+  a server unloads a model) releases everything resolved against it.
+
+  Args:
+    graph: The `Graph` into which the saved model was loaded.
+    signature: A `SignatureDef` proto from the loaded model's `MetaGraphDef`.
+  Returns:
+    A tuple (input_feed_tensors_by_name, output_tensors_by_name) mapping the
+    signature's input/output keys to `Tensor` objects in `graph`.
+  """
+  with _signature_tensor_cache_lock:
+    graph_cache = _signature_tensor_cache.get(graph)
+    if graph_cache is None:
+      graph_cache = {}
+      _signature_tensor_cache[graph] = graph_cache
+    entry = graph_cache.get(id(signature))
+    if entry is None or entry[0] is not signature:
+      input_feed_tensors_by_name = {
+          input_key: graph.as_graph_element(input_value.name)
+          for input_key, input_value in signature.inputs.items()
+      }
+      output_tensors_by_name = {
+          output_key: graph.as_graph_element(output_value.name)
+          for output_key, output_value in signature.outputs.items()
+      }
+      resolved = (input_feed_tensors_by_name, output_tensors_by_name)
+      graph_cache[id(signature)] = (signature, resolved)
+      return resolved
+  return entry[1]
+
+
+def canonicalize_numpy_data_inplace(data, out_buffers):
+  """Canonicalizes `data` into caller-provided pre-allocated buffers.
+
+  Opt-in fast path for server loops: the per-request array allocations made
+  when a filtering function canonicalizes its features thrash the allocator at
+  high request rates. Callers can instead allocate canonical
+  [batch size x series length]-prefixed buffers once and reuse them for every
+  request; values are copied in with `numpy.copyto` (a straight copy with no
+  allocation), or not at all when the caller wrote into the buffer directly.
+
+  Args:
+    data: A dictionary mapping keys to Numpy arrays (requires keys
+      `TrainEvalFeatures.TIMES` and `TrainEvalFeatures.VALUES`) whose values
+      broadcast against the corresponding `out_buffers` entries.
+    out_buffers: A dictionary of pre-allocated Numpy arrays keyed like `data`,
+      with canonical [batch size x series length]-prefixed shapes; `TIMES`
+      must have shape [batch size x series length].
+  Returns:
+    `out_buffers`, filled, validated, and marked canonical, ready to be passed
+    as the features of a filtering call.
+  Raises:
+    ValueError: If required features are missing, a buffer is missing or has a
+      non-canonical shape, or a value cannot be broadcast into its buffer.
+  """
+  if (_TRAIN_EVAL_TIMES_KEY not in data or
+      _TRAIN_EVAL_VALUES_KEY not in data):
+    raise ValueError("{} and {} are required features.".format(
+        _TRAIN_EVAL_TIMES_KEY, _TRAIN_EVAL_VALUES_KEY))
+  for key, value in data.items():
+    if key.startswith("__"):
+      continue
+    out = out_buffers.get(key)
+    if out is None:
+      raise ValueError(
+          "Missing pre-allocated buffer for feature '{}'.".format(key))
+    if value is not out:
+      numpy.copyto(out, value)
+  times_shape = out_buffers[_TRAIN_EVAL_TIMES_KEY].shape
+  if len(times_shape) != 2:
+    raise ValueError(
+        ("Pre-allocated buffers must be in canonical [batch size, series"
+         " length]-prefixed form; got shape {} for '{}'.").format(
+            times_shape, _TRAIN_EVAL_TIMES_KEY))
+  bad_features = [(key, value.shape)
+                  for key, value in out_buffers.items()
+                  if (not key.startswith("__") and
+                      value.shape[:2] != times_shape)]
+  if bad_features:
+    bad_key, bad_shape = bad_features[0]
+    raise ValueError(
+        ("All features must have their shapes prefixed by the shape of the"
+         " times feature. Got shape {} for feature '{}', but shape {} for"
+         " '{}'").format(bad_shape, bad_key, times_shape,
+                         _TRAIN_EVAL_TIMES_KEY))
+  out_buffers[_ALREADY_CANONICAL_KEY] = True
+  return out_buffers
+
+
+def _flatten_state(continue_from):
+  """Returns a continuation's model state as a flat {key: value} dictionary."""
+  if isinstance(continue_from, FilterResult):
+    return continue_from.state
+  if _STATE_TUPLE_KEY in continue_from:
+    state_values = continue_from.get(_FLAT_STATE_CACHE_KEY)
+    if state_values is None:
+      # We're continuing from an evaluation, so we need to unpack/flatten
+      # state. Stash the flattened form on the caller's dictionary (which this
+      # module already treats as mutable) so repeated continuations from the
+      # same output skip re-flattening.
+      state_values = _state_to_dictionary(continue_from[_STATE_TUPLE_KEY])
+      continue_from[_FLAT_STATE_CACHE_KEY] = state_values
+    return state_values
+  return continue_from
+
+
+# In the two helpers below, a single comprehension takes CPython's dict
+# comprehension fast path instead of growing an empty dict insert-by-insert.
+# Private "__"-prefixed keys are bookkeeping, not model inputs. Feeding a
+# contiguous array of exactly the placeholder's dtype lets the TF feed path
+# use the buffer directly instead of converting and copying it in C++;
+# `ascontiguousarray` is a no-op for already-matching inputs.
+
+
+def _colate_features_cold(signature, features, graph):
+  """Constructs feed and fetch dictionaries with no model state inputs."""
+  input_feed_tensors_by_name, output_tensors_by_name = (
+      _resolve_signature_tensors(graph, signature))
+  feed_items = (
+      (input_feed_tensors_by_name[key], value)
+      for key, value in features.items()
+      if not key.startswith("__"))
+  feed_dict = {
+      tensor: _ascontiguousarray(value, dtype=tensor.dtype.as_numpy_dtype)
+      for tensor, value in feed_items
   }
-  output_tensors_by_name = {
-      output_key: graph.as_graph_element(output_value.name)
-      for output_key, output_value in signature.outputs.items()
+  return output_tensors_by_name, feed_dict
+
+
+def _colate_features_with_state(signature, features, graph, flat_state):
+  """Constructs feed and fetch dictionaries including flattened model state."""
+  input_feed_tensors_by_name, output_tensors_by_name = (
+      _resolve_signature_tensors(graph, signature))
+  feed_items = (
+      (input_feed_tensors_by_name[key], value)
+      for key, value in itertools.chain(flat_state.items(),
+                                        features.items())
+      if not key.startswith("__"))
+  feed_dict = {
+      tensor: _ascontiguousarray(value, dtype=tensor.dtype.as_numpy_dtype)
+      for tensor, value in feed_items
   }
-  feed_dict = {}
-  for state_key, state_value in state_values.items():
-    feed_dict[input_feed_tensors_by_name[state_key]] = state_value
-  for feature_key, feature_value in features.items():
-    feed_dict[input_feed_tensors_by_name[feature_key]] = feature_value
   return output_tensors_by_name, feed_dict
 
 
+def _prepare_predict_continuation(continue_from, signatures, session, steps,
+                                  times, exogenous_features, fetch_keys=None):
+  """Builds fetches and feeds for a prediction continuation.
+
+  Shared between the synchronous and asynchronous prediction entry points;
+  everything here is cheap Python-side preparation that runs on the calling
+  thread.
+
+  Returns:
+    A tuple (output_tensors_by_name, feed_dict, predict_times).
+  """
+  if exogenous_features is None:
+    exogenous_features = {}
+  if steps is not None and times is None:
+    # Fast path: relative steps need no validation against absolute times, so
+    # construct the prediction times with one vectorized arange instead of
+    # going through the general canonicalization helper.
+    last_times = _asarray(continue_from[_FILTERING_RESULTS_TIMES_KEY])[:, -1:]
+    predict_times = (
+        last_times + 1 + numpy.arange(steps, dtype=last_times.dtype)[None, :])
+  else:
+    predict_times = _model_utils.canonicalize_times_or_steps_from_output(
+        times=times, steps=steps, previous_model_output=continue_from)
+  features = {_PREDICTION_TIMES_KEY: predict_times}
+  features.update(exogenous_features)
+  if isinstance(signatures, SignatureBundle):
+    predict_signature = signatures.predict
+  else:
+    predict_signature = signatures.signature_def[_PREDICT_SIGNATURE_LABEL]
+  output_tensors_by_name, feed_dict = _colate_features_with_state(
+      signature=predict_signature,
+      features=features,
+      graph=session.graph,
+      flat_state=_flatten_state(continue_from))
+  if fetch_keys is not None:
+    # Build a filtered copy; the resolved dictionary is shared through the
+    # signature tensor cache and must not be mutated. Fetching fewer outputs
+    # lets TF skip computing ops only needed by the dropped outputs.
+    fetch_keys = frozenset(fetch_keys)
+    output_tensors_by_name = {
+        key: tensor for key, tensor in output_tensors_by_name.items()
+        if key in fetch_keys
+    }
+  return output_tensors_by_name, feed_dict, predict_times
+
+
 def predict_continuation(continue_from,
                          signatures,
                          session,
                          steps=None,
                          times=None,
-                         exogenous_features=None):
+                         exogenous_features=None,
+                         fetch_keys=None):
   """Perform prediction using an exported saved model.
 
   Args:
@@ -157,8 +524,9 @@ def predict_continuation(continue_from,
       evaluate method or filter_continuation. Used to determine the model
       state to make predictions starting from.
     signatures: The `MetaGraphDef` protocol buffer returned from
-      `tf.saved_model.loader.load`. Used to determine the names of Tensors to
-      feed and fetch. Must be from the same model as `continue_from`.
+      `tf.saved_model.loader.load`, or a `SignatureBundle` constructed from it.
+      Used to determine the names of Tensors to feed and fetch. Must be from
+      the same model as `continue_from`.
     session: The session to use. The session's graph must be the one into which
       `tf.saved_model.loader.load` loaded the model.
     steps: The number of steps to predict (scalar), starting after the
@@ -175,6 +543,11 @@ def predict_continuation(continue_from,
       the batch dimension used when creating `continue_from`, and `window_size`
       is either the `steps` argument or the `window_size` of the `times`
       argument (depending on which was specified).
+    fetch_keys: Optional iterable of output keys (e.g. ["mean"]) to fetch. If
+      specified, only the requested outputs are fetched, and TensorFlow skips
+      computing ops needed only by the dropped outputs (the covariance
+      computation, for example, is often substantial). By default all of the
+      signature's outputs are fetched.
   Returns:
     A dictionary with model-specific predictions (typically having keys "mean"
     and "covariance") and a _feature_keys.PredictionResults.TIMES key indicating
@@ -182,25 +555,222 @@ def predict_continuation(continue_from,
   Raises:
     ValueError: If `times` or `steps` are misspecified.
   """
-  if exogenous_features is None:
-    exogenous_features = {}
-  predict_times = _model_utils.canonicalize_times_or_steps_from_output(
-      times=times, steps=steps, previous_model_output=continue_from)
-  features = {_feature_keys.PredictionFeatures.TIMES: predict_times}
-  features.update(exogenous_features)
-  predict_signature = signatures.signature_def[
-      _feature_keys.SavedModelLabels.PREDICT]
-  output_tensors_by_name, feed_dict = _colate_features_to_feeds_and_fetches(
-      continue_from=continue_from,
-      signature=predict_signature,
-      features=features,
-      graph=session.graph)
+  output_tensors_by_name, feed_dict, predict_times = (
+      _prepare_predict_continuation(
+          continue_from=continue_from,
+          signatures=signatures,
+          session=session,
+          steps=steps,
+          times=times,
+          exogenous_features=exogenous_features,
+          fetch_keys=fetch_keys))
   output = session.run(output_tensors_by_name, feed_dict=feed_dict)
-  output[_feature_keys.PredictionResults.TIMES] = features[
-      _feature_keys.PredictionFeatures.TIMES]
+  output[_PREDICTION_RESULTS_TIMES_KEY] = predict_times
   return output
 
 
+def predict_continuation_batch(list_of_continue_from,
+                               signatures,
+                               session,
+                               steps=None,
+                               times=None,
+                               list_of_exogenous_features=None):
+  """Perform prediction for several independent series with one session.run.
+
+  Calling `predict_continuation` in a loop pays Session.run dispatch overhead
+  once per series. This function stacks the model state (and times) of several
+  `continue_from` dictionaries along the batch axis, issues a single batched
+  `session.run`, and splits the outputs back into one dictionary per input.
+  One N-batch run is dramatically cheaper than N single-batch runs, so this is
+  the preferred entry point when serving multiple series against one model.
+
+  All inputs must come from the same model, and corresponding state Tensors
+  must share dtype and per-example shape so they can be concatenated.
+
+  Args:
+    list_of_continue_from: A non-empty list of dictionaries, each containing
+      the results of either an Estimator's evaluate method or a filtering step
+      (cold start or continuation), as accepted by `predict_continuation`'s
+      `continue_from` argument.
+    signatures: The `MetaGraphDef` protocol buffer returned from
+      `tf.saved_model.loader.load`, or a `SignatureBundle` constructed from it.
+      Used to determine the names of Tensors to feed and fetch. Must be from
+      the same model as `list_of_continue_from`.
+    session: The session to use. The session's graph must be the one into which
+      `tf.saved_model.loader.load` loaded the model.
+    steps: The number of steps to predict (scalar), starting after the
+      evaluation or filtering, shared by every series. If `times` is specified,
+      `steps` must not be; one is required.
+    times: A [total_batch_size x window_size] array of integers (not a Tensor)
+      indicating times to make predictions for, where `total_batch_size` is the
+      sum of the batch dimensions of `list_of_continue_from`. If `steps` is
+      specified, `times` must not be; one is required.
+    list_of_exogenous_features: Optional list of dictionaries, parallel to
+      `list_of_continue_from`, each matching the `exogenous_features` argument
+      of `predict_continuation`. All dictionaries must share the same keys.
+  Returns:
+    A list of dictionaries, parallel to `list_of_continue_from`, each matching
+    the return value of `predict_continuation` for the corresponding input.
+  Raises:
+    ValueError: If `times` or `steps` are misspecified, if the state
+      dictionaries have mismatched keys, dtypes, or per-example shapes, or if
+      `list_of_exogenous_features` has the wrong length.
+  """
+  if not list_of_continue_from:
+    raise ValueError("`list_of_continue_from` must be non-empty.")
+  per_key_values = None
+  batch_sizes = []
+  for continue_from in list_of_continue_from:
+    if _STATE_TUPLE_KEY in continue_from:
+      state_values = _state_to_dictionary(
+          continue_from[_STATE_TUPLE_KEY])
+    else:
+      state_values = {
+          key: value for key, value in continue_from.items()
+          if key != _FILTERING_RESULTS_TIMES_KEY and not key.startswith("__")
+      }
+    state_values[_FILTERING_RESULTS_TIMES_KEY] = continue_from[
+        _FILTERING_RESULTS_TIMES_KEY]
+    state_values = {
+        key: numpy.asarray(value) for key, value in state_values.items()
+    }
+    batch_sizes.append(state_values[_FILTERING_RESULTS_TIMES_KEY].shape[0])
+    if per_key_values is None:
+      per_key_values = {key: [value] for key, value in state_values.items()}
+    else:
+      if set(state_values.keys()) != set(per_key_values.keys()):
+        raise ValueError(
+            "All elements of `list_of_continue_from` must have the same keys;"
+            " got {} and {}.".format(
+                sorted(per_key_values.keys()), sorted(state_values.keys())))
+      for key, value in state_values.items():
+        first_value = per_key_values[key][0]
+        if (value.dtype != first_value.dtype or
+            value.shape[1:] != first_value.shape[1:]):
+          raise ValueError(
+              ("State value for key '{}' has dtype {} and per-example shape"
+               " {}, but an earlier element has dtype {} and per-example"
+               " shape {}; all elements must match to be batched.").format(
+                   key, value.dtype, value.shape[1:], first_value.dtype,
+                   first_value.shape[1:]))
+        per_key_values[key].append(value)
+  merged_continue_from = {
+      key: numpy.concatenate(values, axis=0) if len(values) > 1 else values[0]
+      for key, values in per_key_values.items()
+  }
+  if list_of_exogenous_features is None:
+    exogenous_features = None
+  else:
+    if len(list_of_exogenous_features) != len(list_of_continue_from):
+      raise ValueError(
+          "`list_of_exogenous_features` must be parallel to"
+          " `list_of_continue_from` (got lengths {} and {}).".format(
+              len(list_of_exogenous_features), len(list_of_continue_from)))
+    exogenous_features = {
+        key: numpy.concatenate(
+            [numpy.asarray(exogenous[key])
+             for exogenous in list_of_exogenous_features],
+            axis=0)
+        for key in list_of_exogenous_features[0]
+    }
+  batched_output = predict_continuation(
+      continue_from=merged_continue_from,
+      signatures=signatures,
+      session=session,
+      steps=steps,
+      times=times,
+      exogenous_features=exogenous_features)
+  split_indices = numpy.cumsum(batch_sizes[:-1])
+  outputs = [{} for _ in batch_sizes]
+  for key, value in batched_output.items():
+    for output, piece in zip(outputs,
+                             numpy.split(value, split_indices, axis=0)):
+      output[key] = piece
+  return outputs
+
+
+def predict_continuation_compiled(compiled, state_values, feature_values):
+  """Perform prediction using a pre-compiled PREDICT signature.
+
+  This is the fast path for tight loops making repeated predictions: the
+  caller constructs one `CompiledSignature` for the PREDICT signature, then
+  passes flat value tuples here instead of dictionaries, skipping feed_dict
+  construction and validation on every call.
+
+  Args:
+    compiled: A `CompiledSignature` wrapping the PREDICT signature.
+    state_values: A tuple of state arrays, ordered like the `state_key_order`
+      with which `compiled` was constructed.
+    feature_values: A tuple of feature arrays (prediction times plus any
+      exogenous features), ordered like the `feature_key_order` with which
+      `compiled` was constructed.
+  Returns:
+    A dictionary with model-specific predictions, keyed like the signature's
+    outputs.
+  """
+  return compiled.run(tuple(state_values) + tuple(feature_values))
+
+
+def predict_continuation_async(pool,
+                               continue_from,
+                               signatures,
+                               session,
+                               steps=None,
+                               times=None,
+                               exogenous_features=None):
+  """Perform prediction on a thread pool, overlapping concurrent requests.
+
+  `session.run` releases the GIL while the graph executes, so concurrent
+  requests against the same `Session` can overlap their TensorFlow execution
+  even when issued from Python threads. This entry point builds the feeds on
+  the calling thread (cheap Python-side work) and submits only the
+  `session.run` call to `pool`. For submitted calls to actually execute
+  concurrently, the session should be configured with
+  `inter_op_parallelism_threads > 1`.
+
+  Args:
+    pool: A `concurrent.futures.ThreadPoolExecutor` (or compatible executor)
+      to run the `session.run` call on.
+    continue_from: A dictionary containing the results of either an Estimator's
+      evaluate method or filter_continuation. Used to determine the model
+      state to make predictions starting from.
+    signatures: The `MetaGraphDef` protocol buffer returned from
+      `tf.saved_model.loader.load`, or a `SignatureBundle` constructed from it.
+      Used to determine the names of Tensors to feed and fetch. Must be from
+      the same model as `continue_from`.
+    session: The session to use. The session's graph must be the one into which
+      `tf.saved_model.loader.load` loaded the model.
+    steps: The number of steps to predict (scalar), starting after the
+      evaluation or filtering. If `times` is specified, `steps` must not be;
+      one is required.
+    times: A [batch_size x window_size] array of integers (not a Tensor)
+      indicating times to make predictions for. If `steps` is specified,
+      `times` must not be; one is required.
+    exogenous_features: Optional dictionary with the same semantics as the
+      corresponding argument of `predict_continuation`.
+  Returns:
+    A `concurrent.futures.Future` whose result is the dictionary
+    `predict_continuation` would have returned.
+  Raises:
+    ValueError: If `times` or `steps` are misspecified.
+  """
+  output_tensors_by_name, feed_dict, predict_times = (
+      _prepare_predict_continuation(
+          continue_from=continue_from,
+          signatures=signatures,
+          session=session,
+          steps=steps,
+          times=times,
+          exogenous_features=exogenous_features))
+
+  def _run_prediction():
+    output = session.run(output_tensors_by_name, feed_dict=feed_dict)
+    output[_PREDICTION_RESULTS_TIMES_KEY] = predict_times
+    return output
+
+  return pool.submit(_run_prediction)
+
+
 def cold_start_filter(signatures, session, features):
   """Perform filtering using an exported saved model.
 
@@ -212,8 +782,9 @@ def cold_start_filter(signatures, session, features):
 
   Args:
     signatures: The `MetaGraphDef` protocol buffer returned from
-      `tf.saved_model.loader.load`. Used to determine the names of Tensors to
-      feed and fetch. Must be from the same model as `continue_from`.
+      `tf.saved_model.loader.load`, or a `SignatureBundle` constructed from it.
+      Used to determine the names of Tensors to feed and fetch. Must be from
+      the same model as `continue_from`.
     session: The session to use. The session's graph must be the one into which
       `tf.saved_model.loader.load` loaded the model.
     features: A dictionary mapping keys to Numpy arrays, with several possible
@@ -230,21 +801,27 @@ def cold_start_filter(signatures, session, features):
       In any case, `VALUES` and any exogenous features must have their shapes
       prefixed by the shape of the value corresponding to the `TIMES` key.
   Returns:
-    A dictionary containing model state updated to account for the observations
-    in `features`.
+    A `FilterResult` (a dict subclass) containing model state updated to
+    account for the observations in `features`.
   """
-  filter_signature = signatures.signature_def[
-      _feature_keys.SavedModelLabels.COLD_START_FILTER]
+  if isinstance(signatures, SignatureBundle):
+    filter_signature = signatures.cold_start_filter
+  else:
+    filter_signature = signatures.signature_def[
+        _COLD_START_FILTER_SIGNATURE_LABEL]
   features = _canonicalize_numpy_data(data=features, require_single_batch=False)
-  output_tensors_by_name, feed_dict = _colate_features_to_feeds_and_fetches(
+  output_tensors_by_name, feed_dict = _colate_features_cold(
       signature=filter_signature,
       features=features,
       graph=session.graph)
-  output = session.run(output_tensors_by_name, feed_dict=feed_dict)
+  # Wrap (without copying values) rather than returning the plain session.run
+  # dict so downstream chaining can use structured attribute access.
+  output = FilterResult(
+      session.run(output_tensors_by_name, feed_dict=feed_dict))
   # Make it easier to chain filter -> predict by keeping track of the current
   # time.
-  output[_feature_keys.FilteringResults.TIMES] = features[
-      _feature_keys.FilteringFeatures.TIMES]
+  output[_FILTERING_RESULTS_TIMES_KEY] = features[
+      _FILTERING_TIMES_KEY]
   return output
 
 
@@ -260,8 +837,9 @@ def filter_continuation(continue_from, signatures, session, features):
       evaluate method or a previous filter step (cold start or
       continuation). Used to determine the model state to start filtering from.
     signatures: The `MetaGraphDef` protocol buffer returned from
-      `tf.saved_model.loader.load`. Used to determine the names of Tensors to
-      feed and fetch. Must be from the same model as `continue_from`.
+      `tf.saved_model.loader.load`, or a `SignatureBundle` constructed from it.
+      Used to determine the names of Tensors to feed and fetch. Must be from
+      the same model as `continue_from`.
     session: The session to use. The session's graph must be the one into which
       `tf.saved_model.loader.load` loaded the model.
     features: A dictionary mapping keys to Numpy arrays, with several possible
@@ -278,22 +856,136 @@ def filter_continuation(continue_from, signatures, session, features):
       In any case, `VALUES` and any exogenous features must have their shapes
       prefixed by the shape of the value corresponding to the `TIMES` key.
   Returns:
-    A dictionary containing model state updated to account for the observations
-    in `features`.
+    A `FilterResult` (a dict subclass) containing model state updated to
+    account for the observations in `features`.
   """
-  filter_signature = signatures.signature_def[
-      _feature_keys.SavedModelLabels.FILTER]
+  if isinstance(signatures, SignatureBundle):
+    filter_signature = signatures.filter
+  else:
+    filter_signature = signatures.signature_def[_FILTER_SIGNATURE_LABEL]
   features = _canonicalize_numpy_data(data=features, require_single_batch=False)
-  output_tensors_by_name, feed_dict = _colate_features_to_feeds_and_fetches(
-      continue_from=continue_from,
+  output_tensors_by_name, feed_dict = _colate_features_with_state(
       signature=filter_signature,
       features=features,
-      graph=session.graph)
-  output = session.run(output_tensors_by_name, feed_dict=feed_dict)
+      graph=session.graph,
+      flat_state=_flatten_state(continue_from))
+  # Wrap (without copying values) rather than returning the plain session.run
+  # dict so downstream chaining can use structured attribute access.
+  output = FilterResult(
+      session.run(output_tensors_by_name, feed_dict=feed_dict))
   # Make it easier to chain filter -> predict by keeping track of the current
   # time.
-  output[_feature_keys.FilteringResults.TIMES] = features[
-      _feature_keys.FilteringFeatures.TIMES]
+  output[_FILTERING_RESULTS_TIMES_KEY] = features[
+      _FILTERING_TIMES_KEY]
   return output
 
+
+def filter_and_predict_continuation(continue_from,
+                                    signatures,
+                                    session,
+                                    filter_features,
+                                    predict_steps=None,
+                                    predict_times=None,
+                                    exogenous_features=None):
+  """Perform filtering and prediction with a single `session.run` call.
+
+  Chaining `filter_continuation` and `predict_continuation` issues two
+  `session.run` calls, each paying Python dispatch and feed marshalling
+  overhead. This function fuses the two signatures into one fetch structure so
+  a single `session.run` services both, which roughly halves per-request
+  overhead for short prediction horizons.
+
+  The PREDICT signature's state inputs are not fed here, so the loaded saved
+  model must have been exported with a shared subgraph in which the PREDICT
+  signature consumes the FILTER signature's output state directly, through
+  placeholders disjoint from the FILTER signature's. Models exported by this
+  package's estimators reuse one set of input placeholders across all three
+  signatures and so do not qualify; since fusing their feeds would silently
+  clobber the filter's times/exogenous values with the predict values, any
+  placeholder overlap is rejected with `ValueError`. For such models, chain
+  `filter_continuation` and `predict_continuation` instead.
+
+  Args:
+    continue_from: A dictionary containing the results of either an Estimator's
+      evaluate method or a previous filter step (cold start or
+      continuation). Used to determine the model state to start filtering from.
+    signatures: The `MetaGraphDef` protocol buffer returned from
+      `tf.saved_model.loader.load`, or a `SignatureBundle` constructed from it.
+      Used to determine the names of Tensors to feed and fetch. Must be from
+      the same model as `continue_from`.
+    session: The session to use. The session's graph must be the one into which
+      `tf.saved_model.loader.load` loaded the model.
+    filter_features: A dictionary mapping keys to Numpy arrays containing the
+      new observations to filter on, with the same accepted shapes as the
+      `features` argument of `filter_continuation`.
+    predict_steps: The number of steps to predict (scalar), starting after the
+      filtering step. If `predict_times` is specified, `predict_steps` must not
+      be; one is required.
+    predict_times: A [batch_size x window_size] array of integers (not a
+      Tensor) indicating times to make predictions for. These times must be
+      after the times in `filter_features`. If `predict_steps` is specified,
+      `predict_times` must not be; one is required.
+    exogenous_features: Optional dictionary. If specified, indicates exogenous
+      features for the model to use while making the predictions, with the same
+      semantics as the corresponding argument of `predict_continuation`.
+  Returns:
+    A tuple (filtering_results, predictions), where `filtering_results` matches
+    the return value of `filter_continuation` and `predictions` matches the
+    return value of `predict_continuation`.
+  Raises:
+    ValueError: If `predict_times` or `predict_steps` are misspecified, or if
+      the FILTER and PREDICT signatures share input placeholders and therefore
+      cannot be fed in one `session.run` without clobbering each other.
+  """
+  if exogenous_features is None:
+    exogenous_features = {}
+  if isinstance(signatures, SignatureBundle):
+    filter_signature = signatures.filter
+    predict_signature = signatures.predict
+  else:
+    filter_signature = signatures.signature_def[_FILTER_SIGNATURE_LABEL]
+    predict_signature = signatures.signature_def[_PREDICT_SIGNATURE_LABEL]
+  filter_features = _canonicalize_numpy_data(
+      data=filter_features, require_single_batch=False)
+  predict_times = _model_utils.canonicalize_times_or_steps_from_output(
+      times=predict_times,
+      steps=predict_steps,
+      previous_model_output={
+          _FILTERING_RESULTS_TIMES_KEY:
+              filter_features[_FILTERING_TIMES_KEY]
+      })
+  predict_features = {_PREDICTION_TIMES_KEY: predict_times}
+  predict_features.update(exogenous_features)
+  filter_fetches, filter_feeds = _colate_features_with_state(
+      signature=filter_signature,
+      features=filter_features,
+      graph=session.graph,
+      flat_state=_flatten_state(continue_from))
+  # The PREDICT signature's state inputs come from the shared subgraph, so no
+  # state is fed for it.
+  predict_fetches, predict_feeds = _colate_features_cold(
+      signature=predict_signature,
+      features=predict_features,
+      graph=session.graph)
+  shared_placeholders = set(filter_feeds) & set(predict_feeds)
+  if shared_placeholders:
+    raise ValueError(
+        ("The FILTER and PREDICT signatures share input placeholders ({});"
+         " fusing them into one session.run would clobber the filter's feeds"
+         " with the predict values. This saved model was not exported with a"
+         " shared filter->predict subgraph; chain filter_continuation and"
+         " predict_continuation instead.").format(
+            sorted(tensor.name for tensor in shared_placeholders)))
+  merged_feeds = dict(filter_feeds)
+  merged_feeds.update(predict_feeds)
+  filter_output, predict_output = session.run(
+      (filter_fetches, predict_fetches), feed_dict=merged_feeds)
+  filter_output = FilterResult(filter_output)
+  # Make it easier to keep chaining by keeping track of the current time.
+  filter_output[_FILTERING_RESULTS_TIMES_KEY] = filter_features[
+      _FILTERING_TIMES_KEY]
+  predict_output[_PREDICTION_RESULTS_TIMES_KEY] = predict_features[
+      _PREDICTION_TIMES_KEY]
+  return filter_output, predict_output
+
 remove_undocumented(module_name=__name__)
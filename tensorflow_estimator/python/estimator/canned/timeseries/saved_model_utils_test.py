@@ -0,0 +1,661 @@
+# Copyright 2018 The TensorFlow Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Tests for saved_model_utils.
+
+The canonicalization, feed construction, and batching logic in
+saved_model_utils is pure Python/numpy, so these tests exercise it against
+stub graphs, signatures, and sessions rather than real exported saved models;
+end-to-end coverage against real exports lives in estimators_test.
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+
+import threading
+
+from concurrent import futures
+
+import numpy
+
+from tensorflow.python.platform import test
+from tensorflow_estimator.python.estimator.canned.timeseries import feature_keys
+from tensorflow_estimator.python.estimator.canned.timeseries import saved_model_utils
+
+
+class _StubDtype(object):
+  """Stands in for a `DType` in feed construction."""
+
+  def __init__(self, as_numpy_dtype):
+    self.as_numpy_dtype = as_numpy_dtype
+
+
+class _StubTensor(object):
+  """Stands in for a graph placeholder or output."""
+
+  def __init__(self, name, np_dtype):
+    self.name = name
+    self.dtype = _StubDtype(np_dtype)
+
+
+class _StubTensorInfo(object):
+  """Stands in for a `TensorInfo` proto in a signature's inputs/outputs."""
+
+  def __init__(self, name):
+    self.name = name
+
+
+class _StubSignature(object):
+  """Stands in for a `SignatureDef` proto."""
+
+  def __init__(self, input_names, output_names):
+    self.inputs = {key: _StubTensorInfo(name)
+                   for key, name in input_names.items()}
+    self.outputs = {key: _StubTensorInfo(name)
+                    for key, name in output_names.items()}
+
+
+class _StubGraph(object):
+  """Stands in for a `Graph`, resolving tensor names from a fixed table."""
+
+  def __init__(self, tensors_by_name):
+    self._tensors_by_name = tensors_by_name
+
+  def as_graph_element(self, name):
+    return self._tensors_by_name[name]
+
+
+class _StubSession(object):
+  """Stands in for a `Session`, delegating `run` to a test-provided callable."""
+
+  def __init__(self, graph, run_fn):
+    self.graph = graph
+    self._run_fn = run_fn
+
+  def run(self, fetches, feed_dict=None):
+    return self._run_fn(fetches, feed_dict)
+
+
+def _fail_run(fetches, feed_dict):
+  raise AssertionError("session.run should not be called")
+
+
+class _StubCompilingSession(_StubSession):
+  """A `_StubSession` recording `make_callable` compilations."""
+
+  def __init__(self, graph, callable_fn):
+    super(_StubCompilingSession, self).__init__(graph, _fail_run)
+    self.compiled_fetches = None
+    self.compiled_feed_list = None
+    self._callable_fn = callable_fn
+
+  def make_callable(self, fetches, feed_list):
+    self.compiled_fetches = fetches
+    self.compiled_feed_list = feed_list
+    return self._callable_fn
+
+
+def _stub_bundle(predict=None, filter_signature=None, cold_start_filter=None):
+  """Builds a `SignatureBundle` from stub signatures, with no MetaGraphDef."""
+  bundle = saved_model_utils.SignatureBundle.__new__(
+      saved_model_utils.SignatureBundle)
+  bundle.predict = predict
+  bundle.filter = filter_signature
+  bundle.cold_start_filter = cold_start_filter
+  return bundle
+
+
+def _feeds_by_name(feed_dict):
+  """Re-keys a {tensor: value} feed dictionary by tensor name."""
+  return {tensor.name: value for tensor, value in feed_dict.items()}
+
+
+def _stub_predict_model(run_fn):
+  """Builds a (bundle, session) pair with a stub PREDICT signature."""
+  signature = _StubSignature(
+      input_names={
+          feature_keys.PredictionFeatures.TIMES: "predict_times:0",
+          "model_state_00": "predict_state:0",
+      },
+      output_names={"mean": "mean:0", "covariance": "covariance:0"})
+  graph = _StubGraph({
+      "predict_times:0": _StubTensor("predict_times:0", numpy.int64),
+      "predict_state:0": _StubTensor("predict_state:0", numpy.float32),
+      "mean:0": _StubTensor("mean:0", numpy.float32),
+      "covariance:0": _StubTensor("covariance:0", numpy.float32),
+  })
+  return _stub_bundle(predict=signature), _StubSession(graph, run_fn)
+
+
+class SignatureBundleTest(test.TestCase):
+
+  def test_extracts_signature_defs(self):
+    predict_def = object()
+    filter_def = object()
+    cold_start_def = object()
+
+    class _StubMetaGraphDef(object):
+      signature_def = {
+          feature_keys.SavedModelLabels.PREDICT: predict_def,
+          feature_keys.SavedModelLabels.FILTER: filter_def,
+          feature_keys.SavedModelLabels.COLD_START_FILTER: cold_start_def,
+      }
+
+    bundle = saved_model_utils.SignatureBundle(_StubMetaGraphDef())
+    self.assertIs(predict_def, bundle.predict)
+    self.assertIs(filter_def, bundle.filter)
+    self.assertIs(cold_start_def, bundle.cold_start_filter)
+
+
+class CanonicalizeNumpyDataTest(test.TestCase):
+
+  def test_scalar_example_gets_batch_time_and_feature_dims(self):
+    features = saved_model_utils._canonicalize_numpy_data(
+        {feature_keys.TrainEvalFeatures.TIMES: 1,
+         feature_keys.TrainEvalFeatures.VALUES: 2.},
+        require_single_batch=True)
+    self.assertAllEqual(
+        [1, 1], features[feature_keys.TrainEvalFeatures.TIMES].shape)
+    self.assertAllEqual(
+        [1, 1, 1], features[feature_keys.TrainEvalFeatures.VALUES].shape)
+
+  def test_vector_example_gets_batch_and_feature_dims(self):
+    features = saved_model_utils._canonicalize_numpy_data(
+        {feature_keys.TrainEvalFeatures.TIMES: numpy.arange(3),
+         feature_keys.TrainEvalFeatures.VALUES: numpy.arange(
+             3, dtype=numpy.float32)},
+        require_single_batch=False)
+    self.assertAllEqual(
+        [1, 3], features[feature_keys.TrainEvalFeatures.TIMES].shape)
+    self.assertAllEqual(
+        [1, 3, 1], features[feature_keys.TrainEvalFeatures.VALUES].shape)
+
+  def test_batched_input_passes_through_without_copying(self):
+    times = numpy.arange(6).reshape(2, 3)
+    values = numpy.zeros([2, 3, 1])
+    features = saved_model_utils._canonicalize_numpy_data(
+        {feature_keys.TrainEvalFeatures.TIMES: times,
+         feature_keys.TrainEvalFeatures.VALUES: values},
+        require_single_batch=False)
+    self.assertIs(times, features[feature_keys.TrainEvalFeatures.TIMES])
+    self.assertIs(values, features[feature_keys.TrainEvalFeatures.VALUES])
+
+  def test_already_canonical_dict_is_returned_as_is(self):
+    features = saved_model_utils._canonicalize_numpy_data(
+        {feature_keys.TrainEvalFeatures.TIMES: numpy.arange(3),
+         feature_keys.TrainEvalFeatures.VALUES: numpy.zeros([3])},
+        require_single_batch=False)
+    self.assertIs(
+        features,
+        saved_model_utils._canonicalize_numpy_data(
+            features, require_single_batch=False))
+
+  def test_already_canonical_dict_still_checks_single_batch(self):
+    features = saved_model_utils._canonicalize_numpy_data(
+        {feature_keys.TrainEvalFeatures.TIMES: numpy.arange(6).reshape(2, 3),
+         feature_keys.TrainEvalFeatures.VALUES: numpy.zeros([2, 3, 1])},
+        require_single_batch=False)
+    with self.assertRaisesRegexp(ValueError, "unbatched"):
+      saved_model_utils._canonicalize_numpy_data(
+          features, require_single_batch=True)
+
+  def test_batched_input_rejected_when_single_batch_required(self):
+    with self.assertRaisesRegexp(ValueError, "unbatched"):
+      saved_model_utils._canonicalize_numpy_data(
+          {feature_keys.TrainEvalFeatures.TIMES: numpy.arange(6).reshape(2, 3),
+           feature_keys.TrainEvalFeatures.VALUES: numpy.zeros([2, 3, 1])},
+          require_single_batch=True)
+
+  def test_mismatched_feature_prefix_shapes_rejected(self):
+    with self.assertRaisesRegexp(ValueError, "prefixed by the shape"):
+      saved_model_utils._canonicalize_numpy_data(
+          {feature_keys.TrainEvalFeatures.TIMES: numpy.arange(3),
+           feature_keys.TrainEvalFeatures.VALUES: numpy.zeros([4])},
+          require_single_batch=False)
+
+  def test_missing_required_keys_rejected(self):
+    with self.assertRaisesRegexp(ValueError, "required features"):
+      saved_model_utils._canonicalize_numpy_data(
+          {feature_keys.TrainEvalFeatures.TIMES: numpy.arange(3)},
+          require_single_batch=False)
+
+
+class CanonicalizeNumpyDataInplaceTest(test.TestCase):
+
+  def test_copies_into_buffers_and_marks_canonical(self):
+    out_buffers = {
+        feature_keys.TrainEvalFeatures.TIMES: numpy.zeros(
+            [1, 3], dtype=numpy.int64),
+        feature_keys.TrainEvalFeatures.VALUES: numpy.zeros([1, 3, 1]),
+    }
+    data = {
+        feature_keys.TrainEvalFeatures.TIMES: numpy.arange(
+            3, dtype=numpy.int64)[None, :],
+        feature_keys.TrainEvalFeatures.VALUES: numpy.ones([1, 3, 1]),
+    }
+    result = saved_model_utils.canonicalize_numpy_data_inplace(
+        data, out_buffers)
+    self.assertIs(out_buffers, result)
+    self.assertAllEqual(
+        data[feature_keys.TrainEvalFeatures.TIMES],
+        out_buffers[feature_keys.TrainEvalFeatures.TIMES])
+    self.assertAllEqual(
+        data[feature_keys.TrainEvalFeatures.VALUES],
+        out_buffers[feature_keys.TrainEvalFeatures.VALUES])
+    # The result is accepted as-is by the normal canonicalization entry point.
+    self.assertIs(
+        result,
+        saved_model_utils._canonicalize_numpy_data(
+            result, require_single_batch=False))
+
+  def test_skips_copy_when_caller_wrote_buffer_directly(self):
+    times = numpy.arange(3, dtype=numpy.int64)[None, :]
+    values = numpy.ones([1, 3, 1])
+    out_buffers = {
+        feature_keys.TrainEvalFeatures.TIMES: times,
+        feature_keys.TrainEvalFeatures.VALUES: values,
+    }
+    result = saved_model_utils.canonicalize_numpy_data_inplace(
+        {feature_keys.TrainEvalFeatures.TIMES: times,
+         feature_keys.TrainEvalFeatures.VALUES: values}, out_buffers)
+    self.assertIs(times, result[feature_keys.TrainEvalFeatures.TIMES])
+    self.assertIs(values, result[feature_keys.TrainEvalFeatures.VALUES])
+
+  def test_missing_buffer_rejected(self):
+    with self.assertRaisesRegexp(ValueError, "pre-allocated buffer"):
+      saved_model_utils.canonicalize_numpy_data_inplace(
+          {feature_keys.TrainEvalFeatures.TIMES: numpy.zeros([1, 3]),
+           feature_keys.TrainEvalFeatures.VALUES: numpy.zeros([1, 3, 1])},
+          {feature_keys.TrainEvalFeatures.TIMES: numpy.zeros([1, 3])})
+
+  def test_non_canonical_buffer_shape_rejected(self):
+    out_buffers = {
+        feature_keys.TrainEvalFeatures.TIMES: numpy.zeros(
+            [3], dtype=numpy.int64),
+        feature_keys.TrainEvalFeatures.VALUES: numpy.zeros([3]),
+    }
+    with self.assertRaisesRegexp(ValueError, "canonical"):
+      saved_model_utils.canonicalize_numpy_data_inplace(
+          {feature_keys.TrainEvalFeatures.TIMES: numpy.arange(3),
+           feature_keys.TrainEvalFeatures.VALUES: numpy.zeros([3])},
+          out_buffers)
+
+
+class FilterResultTest(test.TestCase):
+
+  def test_times_and_state_accessors(self):
+    times = numpy.arange(3)[None, :]
+    state = numpy.zeros([1, 2])
+    result = saved_model_utils.FilterResult({
+        feature_keys.FilteringResults.TIMES: times,
+        "model_state_00": state,
+    })
+    self.assertIs(times, result.times)
+    self.assertEqual(["model_state_00"], list(result.state.keys()))
+    self.assertIs(state, result.state["model_state_00"])
+
+  def test_state_excludes_private_keys_and_is_cached(self):
+    result = saved_model_utils.FilterResult({
+        feature_keys.FilteringResults.TIMES: numpy.arange(3)[None, :],
+        "model_state_00": numpy.zeros([1, 2]),
+        "__private_bookkeeping": object(),
+    })
+    state = result.state
+    self.assertEqual(["model_state_00"], list(state.keys()))
+    self.assertIs(state, result.state)
+
+  def test_as_dict_returns_plain_dict(self):
+    result = saved_model_utils.FilterResult({"model_state_00": 1})
+    self.assertIs(dict, type(result.as_dict()))
+
+
+class FlattenStateTest(test.TestCase):
+
+  def test_flat_dict_passes_through(self):
+    continue_from = {"model_state_00": numpy.zeros([1, 2])}
+    self.assertIs(continue_from,
+                  saved_model_utils._flatten_state(continue_from))
+
+  def test_filter_result_state_is_used(self):
+    result = saved_model_utils.FilterResult({
+        feature_keys.FilteringResults.TIMES: numpy.arange(3)[None, :],
+        "model_state_00": numpy.zeros([1, 2]),
+    })
+    self.assertIs(result.state, saved_model_utils._flatten_state(result))
+
+  def test_state_tuple_flattened_once_and_cached(self):
+    state = (numpy.zeros([1, 2]), numpy.ones([1, 1]))
+    continue_from = {feature_keys.FilteringResults.STATE_TUPLE: state}
+    flat_state = saved_model_utils._flatten_state(continue_from)
+    self.assertAllEqual(state[0], flat_state["model_state_00"])
+    self.assertAllEqual(state[1], flat_state["model_state_01"])
+    self.assertIs(flat_state, saved_model_utils._flatten_state(continue_from))
+
+
+class CompiledSignatureTest(test.TestCase):
+
+  def _stub_compiled(self, callable_fn):
+    signature = _StubSignature(
+        input_names={
+            feature_keys.PredictionFeatures.TIMES: "predict_times:0",
+            "model_state_00": "predict_state:0",
+        },
+        output_names={"mean": "mean:0", "covariance": "covariance:0"})
+    graph = _StubGraph({
+        "predict_times:0": _StubTensor("predict_times:0", numpy.int64),
+        "predict_state:0": _StubTensor("predict_state:0", numpy.float32),
+        "mean:0": _StubTensor("mean:0", numpy.float32),
+        "covariance:0": _StubTensor("covariance:0", numpy.float32),
+    })
+    session = _StubCompilingSession(graph, callable_fn)
+    compiled = saved_model_utils.CompiledSignature(
+        session=session,
+        signature=signature,
+        feature_key_order=(feature_keys.PredictionFeatures.TIMES,),
+        state_key_order=("model_state_00",))
+    return compiled, session
+
+  def test_compiles_state_before_features(self):
+    compiled, session = self._stub_compiled(lambda *values: [])
+    self.assertEqual(
+        ("model_state_00", feature_keys.PredictionFeatures.TIMES),
+        compiled.feed_key_order)
+    self.assertEqual(
+        ["predict_state:0", "predict_times:0"],
+        [tensor.name for tensor in session.compiled_feed_list])
+    self.assertEqual(
+        {"mean:0", "covariance:0"},
+        {tensor.name for tensor in session.compiled_fetches})
+
+  def test_run_rezips_outputs(self):
+    mean = numpy.zeros([1, 3, 1])
+    covariance = numpy.ones([1, 3, 1])
+    holder = {}
+    calls = []
+
+    def _callable(*values):
+      calls.append(values)
+      return [{"mean:0": mean, "covariance:0": covariance}[tensor.name]
+              for tensor in holder["session"].compiled_fetches]
+
+    compiled, session = self._stub_compiled(_callable)
+    holder["session"] = session
+    state = numpy.zeros([1, 2], dtype=numpy.float32)
+    times = numpy.array([[6, 7, 8]])
+    output = saved_model_utils.predict_continuation_compiled(
+        compiled, state_values=(state,), feature_values=(times,))
+    self.assertEqual(1, len(calls))
+    self.assertIs(state, calls[0][0])
+    self.assertIs(times, calls[0][1])
+    self.assertIs(mean, output["mean"])
+    self.assertIs(covariance, output["covariance"])
+
+
+class PredictContinuationTest(test.TestCase):
+
+  def _continue_from(self):
+    return {
+        feature_keys.FilteringResults.TIMES: numpy.array([[4, 5]]),
+        "model_state_00": numpy.zeros([1, 2], dtype=numpy.float32),
+    }
+
+  def test_steps_fast_path_and_feed_dtypes(self):
+    run_calls = []
+
+    def _run(fetches, feed_dict):
+      run_calls.append((fetches, feed_dict))
+      return {key: numpy.zeros([1, 3]) for key in fetches}
+
+    signatures, session = _stub_predict_model(_run)
+    output = saved_model_utils.predict_continuation(
+        continue_from=self._continue_from(),
+        signatures=signatures,
+        session=session,
+        steps=3)
+    ((fetches, feed_dict),) = run_calls
+    self.assertEqual({"mean", "covariance"}, set(fetches.keys()))
+    feeds = _feeds_by_name(feed_dict)
+    self.assertAllEqual([[6, 7, 8]], feeds["predict_times:0"])
+    self.assertEqual(numpy.int64, feeds["predict_times:0"].dtype)
+    self.assertEqual(numpy.float32, feeds["predict_state:0"].dtype)
+    self.assertAllEqual(
+        [[6, 7, 8]], output[feature_keys.PredictionResults.TIMES])
+
+  def test_fetch_keys_filters_fetches(self):
+    run_calls = []
+
+    def _run(fetches, feed_dict):
+      run_calls.append((fetches, feed_dict))
+      return {key: numpy.zeros([1, 3]) for key in fetches}
+
+    signatures, session = _stub_predict_model(_run)
+    output = saved_model_utils.predict_continuation(
+        continue_from=self._continue_from(),
+        signatures=signatures,
+        session=session,
+        steps=3,
+        fetch_keys=["mean"])
+    ((fetches, _),) = run_calls
+    self.assertEqual(["mean"], list(fetches.keys()))
+    self.assertIn("mean", output)
+
+  def test_batch_stacks_and_splits(self):
+    def _run(fetches, feed_dict):
+      predict_times = _feeds_by_name(feed_dict)["predict_times:0"]
+      return {key: predict_times.astype(numpy.float32) for key in fetches}
+
+    signatures, session = _stub_predict_model(_run)
+    first = {
+        feature_keys.FilteringResults.TIMES: numpy.array([[4, 5]]),
+        "model_state_00": numpy.zeros([1, 2], dtype=numpy.float32),
+    }
+    second = {
+        feature_keys.FilteringResults.TIMES: numpy.array([[10, 11]]),
+        "model_state_00": numpy.ones([1, 2], dtype=numpy.float32),
+    }
+    outputs = saved_model_utils.predict_continuation_batch(
+        list_of_continue_from=[first, second],
+        signatures=signatures,
+        session=session,
+        steps=2)
+    self.assertEqual(2, len(outputs))
+    self.assertAllEqual([[6, 7]], outputs[0]["mean"])
+    self.assertAllEqual([[12, 13]], outputs[1]["mean"])
+    self.assertAllEqual(
+        [[6, 7]], outputs[0][feature_keys.PredictionResults.TIMES])
+    self.assertAllEqual(
+        [[12, 13]], outputs[1][feature_keys.PredictionResults.TIMES])
+
+  def test_batch_rejects_mismatched_keys(self):
+    signatures, session = _stub_predict_model(
+        lambda fetches, feed_dict: self.fail("should not run"))
+    second = {
+        feature_keys.FilteringResults.TIMES: numpy.array([[10, 11]]),
+        "model_state_01": numpy.ones([1, 2], dtype=numpy.float32),
+    }
+    with self.assertRaisesRegexp(ValueError, "same keys"):
+      saved_model_utils.predict_continuation_batch(
+          list_of_continue_from=[self._continue_from(), second],
+          signatures=signatures,
+          session=session,
+          steps=2)
+
+  def test_batch_rejects_mismatched_state_shapes(self):
+    signatures, session = _stub_predict_model(
+        lambda fetches, feed_dict: self.fail("should not run"))
+    second = {
+        feature_keys.FilteringResults.TIMES: numpy.array([[10, 11]]),
+        "model_state_00": numpy.ones([1, 3], dtype=numpy.float32),
+    }
+    with self.assertRaisesRegexp(ValueError, "must match to be batched"):
+      saved_model_utils.predict_continuation_batch(
+          list_of_continue_from=[self._continue_from(), second],
+          signatures=signatures,
+          session=session,
+          steps=2)
+
+  def test_batch_rejects_wrong_exogenous_length(self):
+    signatures, session = _stub_predict_model(
+        lambda fetches, feed_dict: self.fail("should not run"))
+    with self.assertRaisesRegexp(ValueError, "parallel"):
+      saved_model_utils.predict_continuation_batch(
+          list_of_continue_from=[self._continue_from()],
+          signatures=signatures,
+          session=session,
+          steps=2,
+          list_of_exogenous_features=[])
+
+
+class PredictContinuationAsyncTest(test.TestCase):
+
+  def test_returns_future_with_prediction_output(self):
+    run_threads = []
+
+    def _run(fetches, feed_dict):
+      run_threads.append(threading.current_thread())
+      return {key: numpy.zeros([1, 3]) for key in fetches}
+
+    signatures, session = _stub_predict_model(_run)
+    continue_from = {
+        feature_keys.FilteringResults.TIMES: numpy.array([[4, 5]]),
+        "model_state_00": numpy.zeros([1, 2], dtype=numpy.float32),
+    }
+    pool = futures.ThreadPoolExecutor(max_workers=1)
+    try:
+      future = saved_model_utils.predict_continuation_async(
+          pool=pool,
+          continue_from=continue_from,
+          signatures=signatures,
+          session=session,
+          steps=3)
+      output = future.result()
+    finally:
+      pool.shutdown()
+    # session.run happens on the pool's thread; only feed preparation runs on
+    # the calling thread.
+    self.assertEqual(1, len(run_threads))
+    self.assertIsNot(threading.current_thread(), run_threads[0])
+    self.assertEqual(
+        {"mean", "covariance", feature_keys.PredictionResults.TIMES},
+        set(output.keys()))
+    self.assertAllEqual(
+        [[6, 7, 8]], output[feature_keys.PredictionResults.TIMES])
+
+
+class FilterAndPredictContinuationTest(test.TestCase):
+
+  def test_disjoint_placeholders_run_fused(self):
+    # Build FILTER and PREDICT signatures with disjoint placeholders, as a
+    # shared filter->predict subgraph export would have; the fused call must
+    # service both with a single session.run.
+    graph = _StubGraph({
+        "filter_times:0": _StubTensor("filter_times:0", numpy.int64),
+        "filter_values:0": _StubTensor("filter_values:0", numpy.float32),
+        "filter_state:0": _StubTensor("filter_state:0", numpy.float32),
+        "out_state:0": _StubTensor("out_state:0", numpy.float32),
+        "predict_times:0": _StubTensor("predict_times:0", numpy.int64),
+        "mean:0": _StubTensor("mean:0", numpy.float32),
+    })
+    filter_signature = _StubSignature(
+        input_names={
+            feature_keys.FilteringFeatures.TIMES: "filter_times:0",
+            feature_keys.FilteringFeatures.VALUES: "filter_values:0",
+            "model_state_00": "filter_state:0",
+        },
+        output_names={"model_state_00": "out_state:0"})
+    predict_signature = _StubSignature(
+        input_names={feature_keys.PredictionFeatures.TIMES: "predict_times:0"},
+        output_names={"mean": "mean:0"})
+    run_calls = []
+    new_state = numpy.ones([1, 2], dtype=numpy.float32)
+    mean = numpy.zeros([1, 3, 1], dtype=numpy.float32)
+
+    def _run(fetches, feed_dict):
+      run_calls.append((fetches, feed_dict))
+      filter_fetches, predict_fetches = fetches
+      self.assertEqual(["model_state_00"], list(filter_fetches.keys()))
+      self.assertEqual(["mean"], list(predict_fetches.keys()))
+      return {"model_state_00": new_state}, {"mean": mean}
+
+    session = _StubSession(graph, _run)
+    filter_output, predict_output = (
+        saved_model_utils.filter_and_predict_continuation(
+            continue_from={
+                "model_state_00": numpy.zeros([1, 2], dtype=numpy.float32)
+            },
+            signatures=_stub_bundle(
+                predict=predict_signature, filter_signature=filter_signature),
+            session=session,
+            filter_features={
+                feature_keys.FilteringFeatures.TIMES: numpy.array([[3, 4]]),
+                feature_keys.FilteringFeatures.VALUES: numpy.zeros([1, 2, 1]),
+            },
+            predict_steps=3))
+    self.assertEqual(1, len(run_calls))
+    (_, feed_dict), = run_calls
+    feeds = _feeds_by_name(feed_dict)
+    self.assertAllEqual([[3, 4]], feeds["filter_times:0"])
+    self.assertAllEqual(numpy.zeros([1, 2, 1]), feeds["filter_values:0"])
+    self.assertAllEqual(numpy.zeros([1, 2]), feeds["filter_state:0"])
+    self.assertAllEqual([[5, 6, 7]], feeds["predict_times:0"])
+    self.assertIsInstance(filter_output, saved_model_utils.FilterResult)
+    self.assertIs(new_state, filter_output["model_state_00"])
+    self.assertAllEqual([[3, 4]], filter_output.times)
+    self.assertIs(mean, predict_output["mean"])
+    self.assertAllEqual(
+        [[5, 6, 7]], predict_output[feature_keys.PredictionResults.TIMES])
+
+  def test_shared_placeholders_rejected(self):
+    # Build FILTER and PREDICT signatures sharing the times placeholder, as
+    # models exported by this package's estimators do; the fused call must
+    # refuse to run rather than silently clobber the filter's feeds.
+    graph = _StubGraph({
+        "times:0": _StubTensor("times:0", numpy.int64),
+        "values:0": _StubTensor("values:0", numpy.float32),
+        "state:0": _StubTensor("state:0", numpy.float32),
+        "mean:0": _StubTensor("mean:0", numpy.float32),
+    })
+    filter_signature = _StubSignature(
+        input_names={
+            feature_keys.FilteringFeatures.TIMES: "times:0",
+            feature_keys.FilteringFeatures.VALUES: "values:0",
+            "model_state_00": "state:0",
+        },
+        output_names={"model_state_00": "state:0"})
+    predict_signature = _StubSignature(
+        input_names={
+            feature_keys.PredictionFeatures.TIMES: "times:0",
+            "model_state_00": "state:0",
+        },
+        output_names={"mean": "mean:0"})
+    session = _StubSession(
+        graph, lambda fetches, feed_dict: self.fail("should not run"))
+    with self.assertRaisesRegexp(ValueError, "share input placeholders"):
+      saved_model_utils.filter_and_predict_continuation(
+          continue_from={
+              "model_state_00": numpy.zeros([1, 2], dtype=numpy.float32)
+          },
+          signatures=_stub_bundle(
+              predict=predict_signature, filter_signature=filter_signature),
+          session=session,
+          filter_features={
+              feature_keys.FilteringFeatures.TIMES: numpy.array([[3, 4]]),
+              feature_keys.FilteringFeatures.VALUES: numpy.zeros([1, 2, 1]),
+          },
+          predict_steps=2)
+
+
+if __name__ == "__main__":
+  test.main()